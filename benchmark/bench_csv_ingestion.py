@@ -0,0 +1,42 @@
+"""
+Compares the pandas and Hyper COPY engines of create_hyper_from_csv.
+
+Run from the repository root:
+
+    python -m benchmark.bench_csv_ingestion --rows 1000000 10000000
+"""
+import argparse
+import os
+import tempfile
+
+from benchmark.synthetic import write_csv
+from tableau_builder.hyper_utils import create_hyper_from_csv
+
+SCHEMA = {'Order Date': 'date'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000000, 10000000], help='CSV sizes to load')
+    parser.add_argument('--chunk-size', type=int, default=1000000, help='chunk size for the streaming pandas engine')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in args.rows:
+            csv_path = os.path.join(folder, 'orders.csv')
+            write_csv(csv_path, rows)
+            runs = [
+                ('pandas', dict(engine='pandas', schema=SCHEMA)),
+                ('pandas (chunked)', dict(engine='pandas', schema=SCHEMA, chunk_size=args.chunk_size)),
+                ('copy', dict(engine='copy', schema=SCHEMA))
+            ]
+            for name, options in runs:
+                hyper_path = os.path.join(folder, 'orders.hyper')
+                result = create_hyper_from_csv(csv_path, hyper_path, table_name='orders', **options)
+                print('{0:>10} rows  {1:<17} {2:8.2f}s  {3:>12,.0f} rows/s'.format(
+                    rows, name, result.seconds, result.rows_per_second()))
+                os.remove(hyper_path)
+
+
+if __name__ == '__main__':
+    main()
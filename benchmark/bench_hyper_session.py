@@ -0,0 +1,48 @@
+"""
+Compares the time per hyper_utils call with and without a shared HyperSession.
+
+Run from the repository root:
+
+    python -m benchmark.bench_hyper_session --calls 20
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from tableau_builder.hyper_utils import HyperSession, check_domain, check_range, get_hyper_columns
+
+EXAMPLE_HYPER = os.path.join('test', 'orders.hyper')
+SHIP_MODES = ['Standard Class', 'Second Class', 'Same Day', 'First Class']
+
+
+def run_calls(hyper_path, calls, session=None) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        get_hyper_columns(hyper_path, 'orders', 'public', session=session)
+        check_domain(hyper_path, 'Ship Mode', SHIP_MODES, table_name='orders', session=session)
+        check_range(hyper_path, 'Discount', 0, 1, table_name='orders', session=session)
+    return (time.perf_counter() - start) / (calls * 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=20, help='number of rounds of hyper_utils calls')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        hyper_path = os.path.join(folder, 'orders.hyper')
+        shutil.copy(EXAMPLE_HYPER, hyper_path)
+
+        without_session = run_calls(hyper_path, args.calls)
+        with HyperSession() as session:
+            with_session = run_calls(hyper_path, args.calls, session=session)
+
+    print('Time per call without a session: {0:.4f}s'.format(without_session))
+    print('Time per call with a session:    {0:.4f}s'.format(with_session))
+    print('Speed-up: {0:.1f}x'.format(without_session / with_session))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares start-up time and lookup latency of the dict-based JsonRepository with the
+SqliteRepository and CompiledRepository.
+
+Run from the repository root:
+
+    python -m benchmark.bench_repository_lookup --fields 40000 --lookups 1000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmark.synthetic import write_metadata, get_field_names
+from tableau_builder.compiled_metadata import CompiledRepository
+from tableau_builder.json_metadata import JsonRepository
+from tableau_builder.sqlite_metadata import SqliteRepository, import_json
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fields', type=int, default=40000, help='number of items in the repository')
+    parser.add_argument('--lookups', type=int, default=1000, help='number of items to look up')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        metadata_path = os.path.join(folder, 'metadata.json')
+        database_path = os.path.join(folder, 'metadata.db')
+        write_metadata(metadata_path, args.fields)
+        import_json(metadata_path, database_path).close()
+        CompiledRepository(metadata_path)
+
+        names = random.Random(0).sample(get_field_names(args.fields), args.lookups)
+        repositories = [
+            ('json', lambda: JsonRepository(metadata_path)),
+            ('compiled', lambda: CompiledRepository(metadata_path)),
+            ('sqlite', lambda: SqliteRepository(database_path))
+        ]
+        print('{0:<10} {1:>10} {2:>16} {3:>18}'.format('repository', 'load', 'get_metadata', 'hierarchies (batch)'))
+        for name, load in repositories:
+            repository, load_time = timed(load)
+            _, lookup_time = timed(lambda: [repository.get_metadata(field) for field in names])
+            _, hierarchy_time = timed(lambda: repository.get_hierarchies_for_items(names))
+            print('{0:<10} {1:>9.3f}s {2:>13.1f}us {3:>17.3f}s'.format(
+                name, load_time, lookup_time / len(names) * 1e6, hierarchy_time))
+
+
+if __name__ == '__main__':
+    main()
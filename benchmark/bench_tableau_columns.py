@@ -0,0 +1,49 @@
+"""
+Measures how the time to build a Tableau data source grows with the number of columns and
+hierarchies. With columns looked up by name in constant time, the time per column should stay
+roughly flat as the number of columns grows.
+
+Run from the repository root:
+
+    python -m benchmark.bench_tableau_columns --columns 1000 5000 10000
+"""
+import argparse
+import time
+
+from tableau_builder.metadata import Hierarchy
+from tableau_builder.tableau import Tableau
+
+HIERARCHY_SIZE = 5
+
+
+def build(columns: int) -> float:
+    start = time.perf_counter()
+    tableau = Tableau()
+    tableau.set_csv_location('orders.csv')
+    names = ['Field ' + str(index) for index in range(columns)]
+    for name in names:
+        tableau.add_dimension(name)
+    for index in range(0, columns, HIERARCHY_SIZE):
+        hierarchy = Hierarchy('Hierarchy ' + str(index))
+        hierarchy.set_members(names[index:index + HIERARCHY_SIZE])
+        tableau.add_hierarchy(hierarchy)
+    # Hide as many columns again, as hide_other_fields would for unused CSV columns
+    for index in range(columns):
+        name = 'Other ' + str(index)
+        if not tableau.get_column_by_name(name):
+            tableau.hide_field(name)
+    tableau.to_bytes()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--columns', type=int, nargs='+', default=[1000, 5000, 10000], help='numbers of columns to build')
+    args = parser.parse_args()
+    for columns in args.columns:
+        seconds = build(columns)
+        print('{0:>8} columns  {1:8.3f}s  {2:8.2f}us per column'.format(columns, seconds, seconds / columns * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Runs each stage of the build and validation pipeline on synthetic data of several sizes, and records
+the time and peak memory of each so that changes in how the stages scale can be caught.
+
+Build stages (loading the metadata repository, create_tds, create_tdsx and package_tds) use a wide CSV,
+metadata repository and manifest with each number of --columns. Hyper stages (create_hyper_from_csv,
+validate_hyper, check_domain and check_range) use an orders-like CSV with each number of --rows.
+
+Peak memory is the largest amount allocated by Python during the stage, traced with tracemalloc in a
+second run so that tracing doesn't slow the timed run; memory used by the Hyper server process isn't
+included. The peak RSS of the benchmark process so far is recorded too.
+
+Run from the repository root, optionally saving the results and comparing them with an earlier run:
+
+    python -m benchmark.suite --columns 10 1000 10000 100000 --rows 1000 100000 1000000 10000000
+    python -m benchmark.suite --output results.json --baseline baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmark.synthetic import write_csv, write_metadata, write_manifest, write_orders_metadata, write_wide_csv, \
+    CATEGORIES, COLLECTION
+from tableau_builder.dataset import create_tds, create_tdsx, CSV
+from tableau_builder.hyper_utils import HyperSession, check_domain, check_range, create_hyper_from_csv, \
+    validate_hyper, ENGINE_COPY
+from tableau_builder.instrumentation import get_peak_rss
+from tableau_builder.json_metadata import JsonRepository
+from tableau_builder.package import package_tds
+
+ORDERS_TABLE = 'orders'
+ORDERS_FIELDS = ['Row ID', 'Category', 'Region', 'Order Date', 'Quantity', 'Sales', 'Discount']
+ORDERS_SCHEMA = {'Order Date': 'date'}
+
+
+def run_stage(stage: str, size: int, function, repeat=1, trace_memory=True) -> dict:
+    """
+    Times a stage, taking the fastest of repeat runs, then runs it once more with tracemalloc to find its peak memory
+    """
+    seconds = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    peak_bytes = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    result = {
+        'stage': stage,
+        'size': size,
+        'seconds': seconds,
+        'peak_bytes': peak_bytes,
+        'peak_rss_bytes': get_peak_rss()
+    }
+    print('{0:<22} {1:>10,}  {2:10.3f}s  {3:>12}'.format(
+        stage, size, seconds, '-' if peak_bytes is None else '{0:,.1f} MB'.format(peak_bytes / 1024 / 1024)))
+    return result
+
+
+def run_build_stages(folder: str, columns: int, repeat=1, trace_memory=True) -> list:
+    csv_path = os.path.join(folder, 'wide.csv')
+    metadata_path = os.path.join(folder, 'metadata.json')
+    manifest_path = os.path.join(folder, 'dataset.json')
+    tds_path = os.path.join(folder, 'wide.tds')
+    write_wide_csv(csv_path, columns)
+    write_metadata(metadata_path, columns)
+    write_manifest(manifest_path, columns)
+
+    repositories = []
+    results = [run_stage('load_metadata', columns, lambda: repositories.append(JsonRepository(metadata_path)),
+                         repeat, trace_memory)]
+    repository = repositories[0]
+
+    results.append(run_stage('create_tds', columns, lambda: create_tds(
+        metadata_repository=repository, dataset_file=manifest_path, data_file=csv_path, output_file=tds_path,
+        data_source_type=CSV), repeat, trace_memory))
+    results.append(run_stage('create_tdsx', columns, lambda: create_tdsx(
+        metadata_repository=repository, dataset_file=manifest_path, data_file=csv_path,
+        output_file=os.path.join(folder, 'wide'), data_source_type=CSV), repeat, trace_memory))
+    results.append(run_stage('package_tds', columns, lambda: package_tds(
+        tds_path, data_file=csv_path, output_file=os.path.join(folder, 'packaged')), repeat, trace_memory))
+    return results
+
+
+def run_hyper_stages(folder: str, rows: int, repeat=1, trace_memory=True) -> list:
+    csv_path = os.path.join(folder, 'orders.csv')
+    metadata_path = os.path.join(folder, 'orders.json')
+    hyper_path = os.path.join(folder, 'orders.hyper')
+    write_csv(csv_path, rows)
+    write_orders_metadata(metadata_path)
+    repository = JsonRepository(metadata_path)
+
+    results = [run_stage('create_hyper_from_csv', rows, lambda: create_hyper_from_csv(
+        csv_path, hyper_path, table_name=ORDERS_TABLE, schema=ORDERS_SCHEMA, engine=ENGINE_COPY),
+        repeat, trace_memory)]
+    with HyperSession() as session:
+        results.append(run_stage('validate_hyper', rows, lambda: validate_hyper(
+            hyper_path, repository, ORDERS_FIELDS, table_name=ORDERS_TABLE, collection=COLLECTION, session=session),
+            repeat, trace_memory))
+        results.append(run_stage('check_domain', rows, lambda: check_domain(
+            hyper_path, 'Category', CATEGORIES, table_name=ORDERS_TABLE, session=session), repeat, trace_memory))
+        results.append(run_stage('check_range', rows, lambda: check_range(
+            hyper_path, 'Quantity', 1, 14, table_name=ORDERS_TABLE, session=session), repeat, trace_memory))
+    return results
+
+
+def compare(results: list, baseline: list, tolerance: float) -> list:
+    """
+    Compares results with those of an earlier run
+    :return: a description of each stage and size that is slower than the baseline by more than the tolerance
+    """
+    baseline_seconds = {(result['stage'], result['size']): result['seconds'] for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_seconds.get((result['stage'], result['size']))
+        if previous is not None and previous > 0 and result['seconds'] > previous * (1 + tolerance):
+            regressions.append('{0} ({1:,}): {2:.3f}s, was {3:.3f}s'.format(
+                result['stage'], result['size'], result['seconds'], previous))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--columns', type=int, nargs='*', default=[10, 1000, 10000],
+                        help='numbers of columns for the build stages')
+    parser.add_argument('--rows', type=int, nargs='*', default=[1000, 100000, 1000000],
+                        help='numbers of rows for the Hyper stages')
+    parser.add_argument('--repeat', type=int, default=1, help='times to run each stage, keeping the fastest')
+    parser.add_argument('--no-memory', action='store_true', help="don't trace the peak memory of each stage")
+    parser.add_argument('--output', help='path of a JSON file to write the results to')
+    parser.add_argument('--baseline', help='path of the JSON results of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='fraction by which a stage may be slower than the baseline')
+    args = parser.parse_args()
+
+    results = []
+    trace_memory = not args.no_memory
+    with tempfile.TemporaryDirectory() as folder:
+        for columns in args.columns:
+            results.extend(run_build_stages(folder, columns, args.repeat, trace_memory))
+        for rows in args.rows:
+            results.extend(run_hyper_stages(folder, rows, args.repeat, trace_memory))
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results
+            }, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)['results'], args.tolerance)
+        for regression in regressions:
+            print('Slower than baseline: ' + regression)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
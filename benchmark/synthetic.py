@@ -0,0 +1,104 @@
+"""
+Generators for synthetic benchmark data
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ['Furniture', 'Office Supplies', 'Technology']
+REGIONS = ['Central', 'East', 'South', 'West']
+DOMAIN = ['A', 'B', 'C']
+COLLECTION = 'Synthetic'
+WRITE_CHUNK = 1000000
+
+
+def write_csv(csv_path: str, rows: int, seed=0) -> None:
+    """
+    Writes a CSV of orders-like data with integer, text, double and date columns, a chunk at a
+    time so that very large files can be generated in bounded memory
+    """
+    generator = np.random.default_rng(seed)
+    written = 0
+    while written < rows:
+        size = min(WRITE_CHUNK, rows - written)
+        frame = pd.DataFrame({
+            'Row ID': np.arange(written, written + size),
+            'Category': generator.choice(CATEGORIES, size),
+            'Region': generator.choice(REGIONS, size),
+            'Order Date': pd.Timestamp('2020-01-01') + pd.to_timedelta(generator.integers(0, 1500, size), unit='D'),
+            'Quantity': generator.integers(1, 15, size),
+            'Sales': np.round(generator.random(size) * 1000, 2),
+            'Discount': np.round(generator.random(size) * 0.8, 2)
+        })
+        frame.to_csv(csv_path, mode='w' if written == 0 else 'a', header=written == 0, index=False,
+                     date_format='%Y-%m-%d')
+        written += size
+
+
+def get_field_names(fields: int) -> list:
+    return ['Field ' + str(index) for index in range(fields)]
+
+
+def write_wide_csv(csv_path: str, fields: int, rows=10, seed=0) -> None:
+    """
+    Writes a CSV with a column for each of the fields from get_field_names, holding values from the
+    domain used by write_metadata
+    """
+    generator = np.random.default_rng(seed)
+    frame = pd.DataFrame(generator.choice(DOMAIN, (rows, fields)), columns=get_field_names(fields))
+    frame.to_csv(csv_path, index=False)
+
+
+def write_manifest(manifest_path: str, fields: int, collection=COLLECTION) -> None:
+    """
+    Writes a dataset description using every field, with one in ten of them as measures
+    """
+    names = get_field_names(fields)
+    manifest = {
+        'name': 'Synthetic',
+        'description': 'Synthetic dataset with ' + str(fields) + ' fields',
+        'collection': collection,
+        'measures': names[::10],
+        'dimensions': [name for index, name in enumerate(names) if index % 10 != 0]
+    }
+    with open(manifest_path, 'w') as file:
+        json.dump(manifest, file)
+
+
+def write_orders_metadata(metadata_path: str, collection=COLLECTION) -> None:
+    """
+    Writes a JSON metadata repository describing the columns written by write_csv, for validation
+    """
+    items = [
+        {'name': 'Row ID', 'datatype': 'big_int'},
+        {'name': 'Category', 'datatype': 'text', 'domain': CATEGORIES},
+        {'name': 'Region', 'datatype': 'text', 'domain': REGIONS},
+        {'name': 'Order Date', 'datatype': 'date'},
+        {'name': 'Quantity', 'datatype': 'big_int', 'range': {'min': 1, 'max': 14}},
+        {'name': 'Sales', 'datatype': 'double', 'range': {'min': 0, 'max': 1000}},
+        {'name': 'Discount', 'datatype': 'double', 'range': {'min': 0, 'max': 0.8}}
+    ]
+    for item in items:
+        item['description'] = 'Description of ' + item['name']
+    with open(metadata_path, 'w') as file:
+        json.dump({'collection': {'name': collection, 'items': items}}, file)
+
+
+def write_metadata(metadata_path: str, fields: int, group_size=20, hierarchy_size=5) -> None:
+    """
+    Writes a JSON metadata repository with a description, group and hierarchy level for each field
+    """
+    items = []
+    for index, name in enumerate(get_field_names(fields)):
+        items.append({
+            'name': name,
+            'description': 'Description of ' + name,
+            'groups': ['Group ' + str(index // group_size)],
+            'hierarchies': [{'hierarchy': 'Hierarchy ' + str(index // hierarchy_size),
+                             'level': 10 * (index % hierarchy_size + 1)}],
+            'datatype': 'text',
+            'domain': DOMAIN
+        })
+    with open(metadata_path, 'w') as file:
+        json.dump({'collection': {'name': COLLECTION, 'items': items}}, file)